@@ -7,44 +7,80 @@ models in production environments.
 
 __version__ = "0.1.0"
 
-# Core components
-from llamamlops.core.project import Project, ProjectConfig
-from llamamlops.core.environment import Environment, EnvironmentConfig
-from llamamlops.core.registry import ModelRegistry
+import importlib
 
-# Tracking
-from llamamlops.tracking.experiment import Experiment, ExperimentTracker
-from llamamlops.tracking.metrics import MetricsTracker
-from llamamlops.tracking.artifacts import ArtifactManager
-
-# Deployment
-from llamamlops.deployment.model import ModelDeployer, DeploymentConfig
-from llamamlops.deployment.container import ContainerBuilder
-from llamamlops.deployment.runtime import RuntimeEnvironment
+# Public names are resolved lazily (PEP 562) so that importing the package
+# does not pull in every subpackage and its third-party dependencies.
+_LAZY = {
+    # Core components
+    "Project": "llamamlops.core.project",
+    "ProjectConfig": "llamamlops.core.project",
+    "Environment": "llamamlops.core.environment",
+    "EnvironmentConfig": "llamamlops.core.environment",
+    "ModelRegistry": "llamamlops.core.registry",
+    
+    # Tracking
+    "Experiment": "llamamlops.tracking.experiment",
+    "ExperimentTracker": "llamamlops.tracking.experiment",
+    "MetricsTracker": "llamamlops.tracking.metrics",
+    "ArtifactManager": "llamamlops.tracking.artifacts",
+    
+    # Deployment
+    "ModelDeployer": "llamamlops.deployment.model",
+    "DeploymentConfig": "llamamlops.deployment.model",
+    "ContainerBuilder": "llamamlops.deployment.container",
+    "RuntimeEnvironment": "llamamlops.deployment.runtime",
+    
+    # Serving
+    "ModelServer": "llamamlops.serving.api",
+    "ServerConfig": "llamamlops.serving.api",
+    "InferenceEngine": "llamamlops.serving.inference",
+    "ScalingManager": "llamamlops.serving.scaling",
+    
+    # Monitoring
+    "MetricsMonitor": "llamamlops.monitoring.metrics",
+    "AlertManager": "llamamlops.monitoring.alerts",
+    "LogMonitor": "llamamlops.monitoring.logging",
+    "DriftDetector": "llamamlops.monitoring.drift",
+    
+    # Versioning
+    "DataVersion": "llamamlops.versioning.data",
+    "DataVersioning": "llamamlops.versioning.data",
+    "ModelVersion": "llamamlops.versioning.model",
+    "ModelVersioning": "llamamlops.versioning.model",
+    "CodeVersion": "llamamlops.versioning.code",
+    "CodeVersioning": "llamamlops.versioning.code",
+    
+    # Pipelines
+    "Pipeline": "llamamlops.pipelines.pipeline",
+    "PipelineConfig": "llamamlops.pipelines.pipeline",
+    "PipelineStage": "llamamlops.pipelines.stage",
+    "PipelineScheduler": "llamamlops.pipelines.scheduler",
+    
+    # CLI tools
+    "init": "llamamlops.cli.commands",
+    "deploy": "llamamlops.cli.commands",
+    "monitor": "llamamlops.cli.commands",
+    "track": "llamamlops.cli.commands",
+}
 
-# Serving
-from llamamlops.serving.api import ModelServer, ServerConfig
-from llamamlops.serving.inference import InferenceEngine
-from llamamlops.serving.scaling import ScalingManager
 
-# Monitoring
-from llamamlops.monitoring.metrics import MetricsMonitor
-from llamamlops.monitoring.alerts import AlertManager
-from llamamlops.monitoring.logging import LogMonitor
-from llamamlops.monitoring.drift import DriftDetector
+def __getattr__(name):
+    """Import public attributes on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-# Versioning
-from llamamlops.versioning.data import DataVersion, DataVersioning
-from llamamlops.versioning.model import ModelVersion, ModelVersioning
-from llamamlops.versioning.code import CodeVersion, CodeVersioning
 
-# Pipelines
-from llamamlops.pipelines.pipeline import Pipeline, PipelineConfig
-from llamamlops.pipelines.stage import PipelineStage
-from llamamlops.pipelines.scheduler import PipelineScheduler
+def __dir__():
+    """List module attributes, including lazily loaded ones."""
+    return sorted(set(globals()) | set(_LAZY))
 
-# CLI tools
-from llamamlops.cli.commands import init, deploy, monitor, track
 
 __all__ = [
     # Core
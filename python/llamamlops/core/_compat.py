@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers shared by the core modules.
+"""
+import sys
+from typing import Any, Dict
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,46 @@
+"""
+YAML helpers shared by the core modules.
+
+Configs and model metadata are read and written through the libyaml-based
+safe loader/dumper when PyYAML was built with it.
+"""
+
+import functools
+import numbers
+from pathlib import PurePath
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    # PyYAML was built without libyaml; use the pure-Python implementation
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper  # type: ignore[assignment]
+
+
+class PathDumper(YamlDumper):
+    """YAML dumper that writes filesystem paths as plain strings."""
+
+
+def _represent_number(dumper: PathDumper, value: object) -> yaml.Node:
+    """Write numeric scalars such as numpy's as plain YAML ints and floats."""
+    if isinstance(value, numbers.Integral):
+        return dumper.represent_int(int(value))
+    if isinstance(value, numbers.Real):
+        return dumper.represent_float(float(value))
+    return dumper.represent_undefined(value)
+
+
+PathDumper.add_multi_representer(
+    PurePath, lambda dumper, value: dumper.represent_str(str(value))
+)
+# Numbers that aren't exactly int or float only match a representer through
+# their ABCs, which multi representers can't see; catch them under object
+PathDumper.add_multi_representer(object, _represent_number)
+
+# YAML entry points with the loader/dumper and options bound once; keys keep
+# their dataclass field order instead of being re-sorted on every dump
+yaml_load = functools.partial(yaml.load, Loader=YamlLoader)
+yaml_dump = functools.partial(
+    yaml.dump, Dumper=PathDumper, default_flow_style=False, sort_keys=False
+)
@@ -9,11 +9,129 @@ import os
 import sys
 import subprocess
 import shutil
+import tempfile
+import functools
+import secrets
+import weakref
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
+from string import Template
 
-@dataclass
+from llamamlops.core._compat import DATACLASS_OPTIONS
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Cached output of `conda env list`, keyed by the mtime of conda's
+# environments.txt so that creating or removing an env invalidates it.
+_CONDA_ENVS_CACHE: Optional[Tuple[float, List[str]]] = None
+
+
+def _conda_envs_mtime() -> Optional[float]:
+    """Get the modification time of conda's environments registry, if any."""
+    try:
+        return os.stat(os.path.expanduser("~/.conda/environments.txt")).st_mtime
+    except OSError:
+        return None
+
+
+def _list_conda_envs() -> List[str]:
+    """List the prefixes of all known conda environments.
+    
+    Returns:
+        List of environment paths, served from cache when conda's
+        environments registry has not changed since the last call.
+    """
+    global _CONDA_ENVS_CACHE
+    
+    mtime = _conda_envs_mtime()
+    if (mtime is not None and _CONDA_ENVS_CACHE is not None
+            and _CONDA_ENVS_CACHE[0] == mtime):
+        return _CONDA_ENVS_CACHE[1]
+    
+    # Both orjson and json accept bytes, so skip decoding stdout to str
+    result = subprocess.run(
+        ["conda", "env", "list", "--json"],
+        check=True,
+        capture_output=True
+    )
+    envs = _json.loads(result.stdout)["envs"]
+    _CONDA_ENVS_CACHE = (mtime, envs) if mtime is not None else None
+    return envs
+
+
+def _find_conda_env(name: str) -> Optional[str]:
+    """Get the prefix of the conda environment with the given name, if any."""
+    # Match on the exact env directory name, so that e.g. "dev" does not
+    # match ".../envs/dev-legacy"
+    for path in _list_conda_envs():
+        if os.path.basename(path) == name:
+            return path
+    return None
+
+
+def _tool_available(tool: str) -> bool:
+    """Check whether a command-line tool can be run.
+    
+    Args:
+        tool: Name of the executable, e.g. ``conda``.
+        
+    Returns:
+        True if the tool is on PATH and responds to ``--version``.
+    """
+    return _probe_tool(tool, os.environ.get("PATH", ""))
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_tool(tool: str, path: str) -> bool:
+    """Probe a tool once per PATH value; see _tool_available."""
+    if shutil.which(tool, path=path) is None:
+        return False
+    try:
+        subprocess.run([tool, "--version"], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _conda_base() -> str:
+    """Get the conda base (root) prefix."""
+    # conda's shell hook exports CONDA_EXE as <base>/bin/conda
+    # (<base>\Scripts\conda.exe on Windows), which saves a subprocess
+    conda_exe = os.environ.get("CONDA_EXE")
+    if conda_exe:
+        return os.path.dirname(os.path.dirname(conda_exe))
+    
+    result = subprocess.run(
+        ["conda", "info", "--base"],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip()
+
+
+def _conda_envs_dir() -> str:
+    """Get the directory conda creates named environments in."""
+    base = _conda_base()
+    if os.access(base, os.W_OK):
+        return os.path.join(base, "envs")
+    return os.path.join(os.path.expanduser("~"), ".conda", "envs")
+
+
+def _remove_container(container_id: str) -> None:
+    """Force-remove a Docker container, ignoring any failure."""
+    try:
+        subprocess.run(["docker", "rm", "-f", container_id], capture_output=True)
+    except OSError:
+        pass
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class EnvironmentConfig:
     """Configuration for an ML environment."""
     name: str
@@ -46,6 +164,19 @@ class EnvironmentConfig:
 class Environment:
     """Environment management for ML projects."""
     
+    # Dockerfile skeleton; only the substituted blocks vary per environment
+    _DOCKERFILE_TEMPLATE = Template(
+        "FROM $base_image\n"
+        "\n"
+        "${env_block}"
+        "${install_block}"
+        "WORKDIR /app\n"
+        "\n"
+        "COPY . /app/\n"
+        "\n"
+        'CMD ["python", "-m", "llamamlops.cli"]\n'
+    )
+    
     def __init__(self, config: Union[EnvironmentConfig, Dict[str, Any]]):
         """Initialize an environment with the given configuration.
         
@@ -75,6 +206,8 @@ class Environment:
             self.config = config
         
         self.env_path = None
+        self.container_id = None
+        self._container_finalizer = None
     
     @property
     def name(self) -> str:
@@ -113,27 +246,28 @@ class Environment:
         """
         try:
             # Check if conda is available
-            subprocess.run(["conda", "--version"], check=True, capture_output=True)
+            if not _tool_available("conda"):
+                print("conda is not available.")
+                return False
             
             env_name = self.config.name
             
-            # Check if the environment exists
-            result = subprocess.run(
-                ["conda", "env", "list", "--json"],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            import json
-            envs = json.loads(result.stdout)["envs"]
-            env_exists = any(env_name in path for path in envs)
+            # Check if the environment exists. Named envs are usually created
+            # in conda's envs directory, so probe that first and only ask
+            # conda for the full env list when it isn't there.
+            env_path: Optional[str] = os.path.join(_conda_envs_dir(), env_name)
+            if not os.path.isdir(env_path):
+                env_path = _find_conda_env(env_name)
+            env_exists = env_path is not None
             
             if env_exists and force:
                 print(f"Removing existing conda environment: {env_name}")
                 subprocess.run(["conda", "env", "remove", "-n", env_name, "-y"], check=True)
                 env_exists = False
             
-            if not env_exists:
+            if env_exists:
+                self.env_path = env_path
+            else:
                 print(f"Creating conda environment: {env_name}")
                 cmd = [
                     "conda", "create", "-n", env_name,
@@ -142,6 +276,10 @@ class Environment:
                 ]
                 subprocess.run(cmd, check=True)
                 
+                # conda may have used another envs directory (envs_dirs in
+                # .condarc), so take the prefix from its env list
+                self.env_path = _find_conda_env(env_name) or os.path.join(_conda_envs_dir(), env_name)
+                
                 # Install packages
                 if self.config.python_packages:
                     self.install_packages(self.config.python_packages)
@@ -151,19 +289,6 @@ class Environment:
             for key, value in self.config.env_variables.items():
                 os.environ[key] = value
             
-            # Find the environment path
-            result = subprocess.run(
-                ["conda", "env", "list", "--json"],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            envs = json.loads(result.stdout)["envs"]
-            for path in envs:
-                if env_name in path:
-                    self.env_path = path
-                    break
-            
             print(f"Conda environment {env_name} initialized successfully.")
             return True
             
@@ -185,7 +310,9 @@ class Environment:
         """
         try:
             # Check if virtualenv is available
-            subprocess.run(["virtualenv", "--version"], check=True, capture_output=True)
+            if not _tool_available("virtualenv"):
+                print("virtualenv is not available.")
+                return False
             
             env_name = self.config.name
             env_path = Path(".venv") / env_name
@@ -234,7 +361,9 @@ class Environment:
         """
         try:
             # Check if Docker is available
-            subprocess.run(["docker", "--version"], check=True, capture_output=True)
+            if not _tool_available("docker"):
+                print("Docker is not available.")
+                return False
             
             image_name = f"llamamlops-{self.config.name.lower()}"
             
@@ -253,6 +382,10 @@ class Environment:
             
             subprocess.run(cmd, check=True)
             
+            # Keep a container running so that run() can use `docker exec`
+            # instead of paying container startup on every command
+            self._start_container(image_name)
+            
             print(f"Docker environment {image_name} initialized successfully.")
             return True
             
@@ -263,38 +396,109 @@ class Environment:
             print(f"Unexpected error initializing Docker environment: {e}")
             return False
     
+    def _start_container(self, image_name: str) -> None:
+        """Start a long-lived container for running commands.
+        
+        If the container can't be started (e.g. the image has no ``sleep``
+        accepting ``infinity``), ``container_id`` stays None and run() falls
+        back to a fresh ``docker run --rm`` per command.
+        
+        Args:
+            image_name: Name of the Docker image to run.
+        """
+        self.close()
+        
+        # Unique per process and session, so environments with the same name
+        # never share (or remove) each other's container
+        container_name = f"{image_name}-{os.getpid()}-{secrets.token_hex(4)}"
+        cmd = ["docker", "run", "-d", "--rm", "--name", container_name]
+        
+        # Add environment variables
+        for key, value in self.config.env_variables.items():
+            cmd.extend(["-e", f"{key}={value}"])
+        
+        # Add volume mount for current directory
+        cmd.extend(["-v", f"{os.getcwd()}:/app"])
+        
+        cmd.extend(["--entrypoint", "sleep", image_name, "infinity"])
+        
+        try:
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            print(f"Could not start a container from {image_name}, "
+                  f"running each command in a new one: {e.stderr.strip()}")
+            return
+        
+        self.container_id = result.stdout.strip()
+        # Remove the container if the environment is collected or the
+        # interpreter exits without close() being called
+        self._container_finalizer = weakref.finalize(
+            self, _remove_container, self.container_id
+        )
+    
+    def close(self) -> None:
+        """Stop the long-lived container of a Docker environment, if any."""
+        if self._container_finalizer is not None:
+            # Runs _remove_container at most once
+            self._container_finalizer()
+            self._container_finalizer = None
+        self.container_id = None
+    
+    def __enter__(self) -> "Environment":
+        """Enter a context that closes the environment on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the environment's container when leaving the context."""
+        self.close()
+    
     def _create_dockerfile(self, path: str) -> None:
         """Create a Dockerfile for the environment.
         
         Args:
             path: Path to save the Dockerfile.
         """
-        with open(path, 'w') as f:
-            f.write(f"FROM {self.config.base_image}\n\n")
-            
-            # Set environment variables
-            if self.config.env_variables:
-                for key, value in self.config.env_variables.items():
-                    f.write(f"ENV {key}={value}\n")
-                f.write("\n")
-            
-            # Install packages
-            if self.config.python_packages:
-                f.write("RUN pip install --no-cache-dir \\\n")
-                for i, package in enumerate(self.config.python_packages):
-                    if i == len(self.config.python_packages) - 1:
-                        f.write(f"    {package}\n\n")
-                    else:
-                        f.write(f"    {package} \\\n")
-            
-            # Set working directory
-            f.write("WORKDIR /app\n\n")
-            
-            # Copy project files
-            f.write("COPY . /app/\n\n")
-            
-            # Default command
-            f.write('CMD ["python", "-m", "llamamlops.cli"]\n')
+        # Set environment variables
+        env_block = ""
+        if self.config.env_variables:
+            env_block = "".join(
+                f"ENV {key}={value}\n"
+                for key, value in self.config.env_variables.items()
+            ) + "\n"
+        
+        # Install packages
+        install_block = ""
+        if self.config.python_packages:
+            install_block = (
+                "RUN pip install --no-cache-dir \\\n    "
+                + " \\\n    ".join(self.config.python_packages) + "\n\n"
+            )
+        
+        payload = self._DOCKERFILE_TEMPLATE.substitute(
+            base_image=self.config.base_image,
+            env_block=env_block,
+            install_block=install_block,
+        ).encode("utf-8")
+        
+        # Write to a sibling temp file and swap it into place, so concurrent
+        # initializations never see a partially written Dockerfile
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)),
+            prefix=f".{os.path.basename(path)}.",
+            suffix=".tmp"
+        )
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
     
     def install_packages(self, packages: List[str]) -> bool:
         """Install Python packages in the environment.
@@ -308,20 +512,26 @@ class Environment:
         try:
             manager = self.config.manager.lower()
             
-            if manager == "conda":
-                cmd = ["conda", "run", "-n", self.config.name, "pip", "install"]
-                cmd.extend(packages)
-                subprocess.run(cmd, check=True)
-            
-            elif manager == "virtualenv":
-                if sys.platform == "win32":
-                    pip_path = Path(self.env_path) / "Scripts" / "pip"
-                else:
-                    pip_path = Path(self.env_path) / "bin" / "pip"
+            if manager in ("conda", "virtualenv"):
+                if self.env_path is None:
+                    print(f"Environment {self.config.name} is not initialized.")
+                    return False
                 
-                cmd = [str(pip_path), "install"]
-                cmd.extend(packages)
-                subprocess.run(cmd, check=True)
+                # Call the environment's pip directly rather than going
+                # through `conda run`, which activates the env on every call.
+                # Packages go through one requirements file so a single
+                # resolver run covers them all. Wheels are cached in pip's
+                # per-user cache unless params["pip_cache_dir"] overrides it.
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    requirements_path = Path(tmp_dir) / "requirements.txt"
+                    requirements_path.write_text("\n".join(packages) + "\n")
+                    
+                    cmd = [str(self._get_executable("pip")), "install", "--no-input"]
+                    cache_dir = self.config.params.get("pip_cache_dir")
+                    if cache_dir:
+                        cmd.extend(["--cache-dir", os.path.abspath(cache_dir)])
+                    cmd.extend(["-r", str(requirements_path)])
+                    subprocess.run(cmd, check=True)
             
             elif manager == "docker":
                 print("Package installation in Docker is handled during image build.")
@@ -361,16 +571,16 @@ class Environment:
             return subprocess.run(cmd, check=True)
         
         elif manager == "virtualenv":
-            if sys.platform == "win32":
-                python_path = Path(self.env_path) / "Scripts" / "python"
-            else:
-                python_path = Path(self.env_path) / "bin" / "python"
-            
-            cmd = [str(python_path)]
+            cmd = [str(self._get_executable("python"))]
             cmd.extend(command)
             return subprocess.run(cmd, check=True)
         
         elif manager == "docker":
+            if self.container_id is not None:
+                cmd = ["docker", "exec", self.container_id]
+                cmd.extend(command)
+                return subprocess.run(cmd, check=True)
+            
             image_name = f"llamamlops-{self.config.name.lower()}"
             cmd = ["docker", "run", "--rm"]
             
@@ -392,6 +602,19 @@ class Environment:
         else:
             raise ValueError(f"Unsupported environment manager: {manager}")
     
+    def _get_executable(self, name: str) -> Path:
+        """Get the path to an executable inside the environment.
+        
+        Args:
+            name: Name of the executable, e.g. ``pip`` or ``python``.
+            
+        Returns:
+            Path to the executable.
+        """
+        if sys.platform == "win32":
+            return Path(self.env_path) / "Scripts" / name
+        return Path(self.env_path) / "bin" / name
+    
     def __repr__(self) -> str:
         """Get string representation of the environment."""
         return f"Environment(name={self.config.name}, manager={self.config.manager})" 
\ No newline at end of file
@@ -6,14 +6,17 @@ the ProjectConfig for configuring project settings.
 """
 
 import os
-import yaml
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Any, Union
 import datetime
 from pathlib import Path
 
-@dataclass
+from llamamlops.core._compat import DATACLASS_OPTIONS
+from llamamlops.core._yaml import yaml_dump, yaml_load
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ProjectConfig:
     """Configuration for an ML project."""
     name: str
@@ -51,8 +54,11 @@ class ProjectConfig:
     params: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the config to a dictionary."""
-        return asdict(self)
+        """Convert the config to a dictionary.
+        
+        Nested containers are shared with the config rather than deep-copied.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
     
     def to_yaml(self, path: Optional[str] = None) -> Optional[str]:
         """Convert the config to YAML and optionally save to a file.
@@ -64,14 +70,14 @@ class ProjectConfig:
             YAML string if path is None, otherwise None.
         """
         config_dict = self.to_dict()
-        yaml_str = yaml.dump(config_dict, default_flow_style=False)
         
         if path:
+            # Stream straight to the file instead of building the string first
             with open(path, 'w') as f:
-                f.write(yaml_str)
+                yaml_dump(config_dict, f)
             return None
         
-        return yaml_str
+        return yaml_dump(config_dict)
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "ProjectConfig":
@@ -82,7 +88,7 @@ class ProjectConfig:
     def from_yaml(cls, path: str) -> "ProjectConfig":
         """Load a config from a YAML file."""
         with open(path, 'r') as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml_load(f)
         return cls.from_dict(config_dict)
     
     @classmethod
@@ -93,6 +99,14 @@ class ProjectConfig:
         return cls.from_dict(config_dict)
 
 
+# Config file loaders by (lowercase) file extension
+_CONFIG_LOADERS = {
+    ".yaml": ProjectConfig.from_yaml,
+    ".yml": ProjectConfig.from_yaml,
+    ".json": ProjectConfig.from_json,
+}
+
+
 class Project:
     """Main project management class for LlamaMlOps."""
     
@@ -105,12 +119,10 @@ class Project:
         """
         if isinstance(config, str):
             # Load from file
-            if config.endswith('.yaml') or config.endswith('.yml'):
-                self.config = ProjectConfig.from_yaml(config)
-            elif config.endswith('.json'):
-                self.config = ProjectConfig.from_json(config)
-            else:
+            loader = _CONFIG_LOADERS.get(os.path.splitext(config)[1].lower())
+            if loader is None:
                 raise ValueError(f"Unsupported config file format: {config}")
+            self.config = loader(config)
         elif isinstance(config, dict):
             self.config = ProjectConfig.from_dict(config)
         elif isinstance(config, ProjectConfig):
@@ -118,7 +130,7 @@ class Project:
         else:
             raise TypeError(f"Unsupported config type: {type(config)}")
         
-        self.root_dir = Path(self.config.root_dir).absolute()
+        self.root_dir = Path(os.path.abspath(self.config.root_dir))
         self.initialized = False
         
         # Initialize component managers
@@ -186,9 +198,11 @@ class Project:
         
         for dir_name in dirs:
             dir_path = self.root_dir / dir_name
-            if not dir_path.exists():
-                dir_path.mkdir(parents=True, exist_ok=True)
-                print(f"Created directory: {dir_path}")
+            try:
+                dir_path.mkdir(parents=True)
+            except FileExistsError:
+                continue
+            print(f"Created directory: {dir_path}")
         
         # Save project configuration
         config_path = self.root_dir / "llamamlops.yaml"
@@ -5,17 +5,190 @@ This module defines the ModelRegistry class for versioning and storing ML models
 """
 
 import os
+import math
+import copy
 import json
 import shutil
-import yaml
+import tempfile
+import time
 import datetime
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
-import uuid
+import base64
+import secrets
 
+from llamamlops.core._compat import DATACLASS_OPTIONS
+from llamamlops.core._yaml import yaml_dump, yaml_load
 
-@dataclass
+# Bound once to skip the module/class attribute lookups on each call
+_now = datetime.datetime.now
+
+# The process umask, read once; mkstemp creates files readable by the owner
+# only, and the index should get the same mode a plain open() would give it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore[import]
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _is_index_safe(value: Any) -> bool:
+    """Check that a value survives the JSON and msgpack indexes unchanged."""
+    # Exact types only: subclasses such as numpy scalars aren't supported by
+    # every index encoder
+    value_type = type(value)
+    if value is None or value_type in (str, bool):
+        return True
+    if value_type is int:
+        # orjson and msgpack only encode 64-bit integers
+        return -2**63 <= value < 2**64
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_is_index_safe(item) for item in value)
+    if value_type is dict:
+        return all(isinstance(key, str) and _is_index_safe(item)
+                   for key, item in value.items())
+    return False
+
+
+def _dir_size(path: Union[str, Path]) -> int:
+    """Get the total size in bytes of all files under a directory.
+    
+    Args:
+        path: Directory to measure.
+        
+    Returns:
+        Sum of file sizes, following symlinks as ``_copytree`` does.
+    """
+    total = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                total += entry.stat().st_size
+            elif entry.is_dir():
+                total += _dir_size(entry.path)
+    return total
+
+
+# ioctl request that clones a file's extents (FICLONE, Linux only)
+_FICLONE = 0x40049409
+
+# How model files are brought into the registry, see register_model
+_INGEST_MODES = ("copy", "link", "reflink")
+
+
+def _link_file(src: Union[str, Path], dst: Union[str, Path]) -> Union[str, Path]:
+    """Hard-link a file, replacing any existing destination."""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    os.link(src, dst)
+    return dst
+
+
+def _reflink_file(src: Union[str, Path], dst: Union[str, Path]) -> Union[str, Path]:
+    """Clone a file copy-on-write, falling back to a regular copy.
+    
+    Reflinks are supported on filesystems such as Btrfs and XFS; elsewhere
+    (or on other operating systems) the file is copied.
+    """
+    try:
+        import fcntl
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except (ImportError, OSError):
+        return shutil.copy2(src, dst)
+    
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _get_copy_function(ingest_mode: str, src: Path, dst_dir: Path) -> Callable:
+    """Get the function used to bring model files into the registry.
+    
+    Args:
+        ingest_mode: One of "copy", "link" or "reflink".
+        src: Source model file or directory.
+        dst_dir: Registry directory the model is written to.
+        
+    Returns:
+        A copy function taking (src, dst), as used by shutil.copytree.
+    """
+    if ingest_mode == "link":
+        # Hard links cannot cross filesystems
+        if os.stat(src).st_dev == os.stat(dst_dir).st_dev:
+            return _link_file
+        return shutil.copy2
+    if ingest_mode == "reflink":
+        return _reflink_file
+    return shutil.copy2
+
+
+def _copytree(src: Union[str, Path], dst: Union[str, Path],
+              copy_function: Callable = shutil.copy2) -> None:
+    """Copy a directory tree, copying its files concurrently.
+    
+    Behaves like ``shutil.copytree`` (symlinks are followed), but the
+    directory structure is created up front and the file copies are then
+    run on a thread pool. Checkpoints made of many shards thereby keep
+    several copies in flight; shutil copies through in-kernel sendfile on
+    Linux, so the workers spend their time in I/O with the GIL released.
+    
+    Args:
+        src: Source directory.
+        dst: Destination directory. Must not exist.
+        copy_function: Function used to copy each file.
+    """
+    os.makedirs(dst)
+    dirs = [(src, dst)]
+    files = []
+    
+    i = 0
+    while i < len(dirs):
+        src_dir, dst_dir = dirs[i]
+        i += 1
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    os.mkdir(target)
+                    dirs.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+    
+    with ThreadPoolExecutor() as executor:
+        for _ in executor.map(lambda pair: copy_function(*pair), files):
+            pass
+    
+    # Copy directory metadata last, as copying files would modify it
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ModelMetadata:
     """Metadata for a registered model."""
     name: str
@@ -39,7 +212,7 @@ class ModelMetadata:
     training_params: Dict[str, Any] = field(default_factory=dict)
     
     # Timestamps
-    created_at: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    created_at: str = field(default_factory=lambda: _now().isoformat())
     updated_at: Optional[str] = None
     
     # Storage information
@@ -55,8 +228,11 @@ class ModelMetadata:
     custom: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metadata to a dictionary."""
-        return asdict(self)
+        """Convert metadata to a dictionary.
+        
+        Nested containers are shared with the metadata rather than deep-copied.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
     
     @classmethod
     def from_dict(cls, metadata_dict: Dict[str, Any]) -> "ModelMetadata":
@@ -64,24 +240,42 @@ class ModelMetadata:
         return cls(**metadata_dict)
 
 
+# Keys that map onto ModelMetadata fields; anything else goes into `custom`
+_METADATA_FIELDS = frozenset(f.name for f in fields(ModelMetadata))
+
+
 class ModelRegistry:
     """Registry for versioning and storing ML models."""
     
-    def __init__(self, storage_dir: str, project_name: Optional[str] = None):
+    def __init__(self, storage_dir: str, project_name: Optional[str] = None,
+                 index_format: str = "json"):
         """Initialize the model registry.
         
         Args:
             storage_dir: Directory to store models.
             project_name: Optional project name for namespacing.
+            index_format: Format for a new registry index, "json" or
+                "msgpack". Choosing "msgpack" converts an existing JSON
+                index. An existing msgpack index is always used as is.
+                
+        Raises:
+            ValueError: If the index format is not supported.
         """
-        self.storage_dir = Path(storage_dir).absolute()
+        if index_format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported index format: {index_format}")
+        
+        self.storage_dir = Path(os.path.abspath(storage_dir))
         self.project_name = project_name
         
         # Create the storage directory if it doesn't exist
         os.makedirs(self.storage_dir, exist_ok=True)
         
+        # Parsed index, reused while the file's mtime and size are unchanged
+        self._index_cache: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        self._index_stat: Optional[Tuple[int, int]] = None
+        
         # Initialize registry index file if it doesn't exist
-        self.index_file = self.storage_dir / "registry_index.json"
+        self.index_file = self._init_index_file(index_format)
         if not self.index_file.exists():
             self._write_index({})
     
@@ -90,7 +284,8 @@ class ModelRegistry:
                       name: str, 
                       version: Optional[str] = None, 
                       description: str = "",
-                      metadata: Optional[Dict[str, Any]] = None) -> ModelMetadata:
+                      metadata: Optional[Dict[str, Any]] = None,
+                      ingest_mode: str = "copy") -> ModelMetadata:
         """Register a model in the registry.
         
         Args:
@@ -99,10 +294,24 @@ class ModelRegistry:
             version: Version of the model. If None, auto-generates a version.
             description: Description of the model.
             metadata: Additional metadata for the model.
+            ingest_mode: How model files are stored. "copy" copies them,
+                "link" hard-links them when the source is on the same
+                filesystem as the registry, and "reflink" makes
+                copy-on-write clones where the filesystem supports it.
+                Both fall back to copying. Hard-linked files share data
+                with the source, so later in-place edits to the source
+                also change the registered model.
             
         Returns:
             ModelMetadata for the registered model.
+            
+        Raises:
+            ValueError: If the model path does not exist or the ingest mode
+                is not supported.
         """
+        if ingest_mode not in _INGEST_MODES:
+            raise ValueError(f"Unsupported ingest mode: {ingest_mode}")
+        
         # Generate a version if not provided
         if version is None:
             version = self._generate_version()
@@ -117,38 +326,42 @@ class ModelRegistry:
         # Update with additional metadata if provided
         if metadata:
             for key, value in metadata.items():
-                if hasattr(model_metadata, key):
+                if key in _METADATA_FIELDS:
                     setattr(model_metadata, key, value)
                 else:
                     model_metadata.custom[key] = value
         
-        # Create the model directory
         model_dir = self._get_model_dir(name, version)
-        os.makedirs(model_dir, exist_ok=True)
+        source_path = Path(model_path)
+        source_is_file = source_path.is_file()
+        if source_is_file:
+            target_path = model_dir / source_path.name
+            model_metadata.size_bytes = os.path.getsize(source_path)
+        elif source_path.is_dir():
+            target_path = model_dir / "model"
+            model_metadata.size_bytes = _dir_size(source_path)
+        else:
+            raise ValueError(f"Model path does not exist: {model_path}")
+        model_metadata.path = str(target_path.relative_to(self.storage_dir))
+        
+        # Render the metadata first so values YAML can't represent fail
+        # before any files are copied
+        content = yaml_dump(model_metadata.to_dict())
         
         # Copy the model file or directory
-        model_path = Path(model_path)
-        if model_path.is_file():
-            target_path = model_dir / model_path.name
-            shutil.copy2(model_path, target_path)
-            model_metadata.path = str(target_path.relative_to(self.storage_dir))
-            model_metadata.size_bytes = os.path.getsize(model_path)
-        elif model_path.is_dir():
-            target_path = model_dir / "model"
+        os.makedirs(model_dir, exist_ok=True)
+        copy_function = _get_copy_function(ingest_mode, source_path, model_dir)
+        if source_is_file:
+            copy_function(source_path, target_path)
+        else:
             if target_path.exists():
                 shutil.rmtree(target_path)
-            shutil.copytree(model_path, target_path)
-            model_metadata.path = str(target_path.relative_to(self.storage_dir))
-            model_metadata.size_bytes = sum(
-                f.stat().st_size for f in target_path.glob('**/*') if f.is_file()
-            )
-        else:
-            raise ValueError(f"Model path does not exist: {model_path}")
+            _copytree(source_path, target_path, copy_function=copy_function)
         
         # Save metadata
         metadata_path = model_dir / "metadata.yaml"
         with open(metadata_path, 'w') as f:
-            yaml.dump(model_metadata.to_dict(), f, default_flow_style=False)
+            f.write(content)
         
         # Update the registry index
         self._update_index(name, version, model_metadata)
@@ -207,6 +420,13 @@ class ModelRegistry:
             if version is None:
                 raise ValueError(f"No versions found for model: {name}")
         
+        # The index holds the full metadata, so serve it from there and skip
+        # parsing metadata.yaml. Copy it so callers can't alter the cache.
+        entry = self._read_index().get(name, {}).get(version)
+        if entry is not None and "version" in entry:
+            return ModelMetadata.from_dict(copy.deepcopy(entry))
+        
+        # Registries written by older versions only index a few fields
         model_dir = self._get_model_dir(name, version)
         metadata_path = model_dir / "metadata.yaml"
         
@@ -214,7 +434,7 @@ class ModelRegistry:
             raise ValueError(f"Metadata not found for model {name} (version {version})")
         
         with open(metadata_path, 'r') as f:
-            metadata_dict = yaml.safe_load(f)
+            metadata_dict = yaml_load(f)
         
         return ModelMetadata.from_dict(metadata_dict)
     
@@ -233,23 +453,19 @@ class ModelRegistry:
         Raises:
             ValueError: If the model doesn't exist.
         """
-        metadata = self.get_model_metadata(name, version)
-        
-        # Update metadata fields
-        for key, value in metadata_updates.items():
-            if hasattr(metadata, key):
-                setattr(metadata, key, value)
-            else:
-                metadata.custom[key] = value
-        
-        # Update timestamp
-        metadata.updated_at = datetime.datetime.now().isoformat()
+        def apply_updates(metadata: ModelMetadata) -> None:
+            for key, value in metadata_updates.items():
+                if key in _METADATA_FIELDS:
+                    setattr(metadata, key, value)
+                else:
+                    metadata.custom[key] = value
+            metadata.updated_at = _now().isoformat()
         
-        # Save updated metadata
-        model_dir = self._get_model_dir(name, version)
-        metadata_path = model_dir / "metadata.yaml"
-        with open(metadata_path, 'w') as f:
-            yaml.dump(metadata.to_dict(), f, default_flow_style=False)
+        metadata_path = self._get_model_dir(name, version) / "metadata.yaml"
+        try:
+            metadata = self._rewrite_metadata(metadata_path, apply_updates)
+        except FileNotFoundError:
+            raise ValueError(f"Metadata not found for model {name} (version {version})")
         
         # Update the registry index
         self._update_index(name, version, metadata)
@@ -318,10 +534,8 @@ class ModelRegistry:
             return False
         
         if version is None:
-            # Delete all versions
-            versions = list(index[name].keys())
-            for v in versions:
-                self._delete_model_version(name, v)
+            # Delete all versions by removing the model's directory at once
+            shutil.rmtree(self._get_model_root(name), ignore_errors=True)
             
             # Remove from index
             del index[name]
@@ -356,6 +570,20 @@ class ModelRegistry:
         if model_dir.exists():
             shutil.rmtree(model_dir)
     
+    def _get_model_root(self, name: str) -> Path:
+        """Get the directory holding all versions of a model.
+        
+        Args:
+            name: Name of the model.
+            
+        Returns:
+            Path to the model's root directory.
+        """
+        if self.project_name:
+            return self.storage_dir / self.project_name / name
+        else:
+            return self.storage_dir / name
+    
     def _get_model_dir(self, name: str, version: str) -> Path:
         """Get the directory for a model version.
         
@@ -366,32 +594,84 @@ class ModelRegistry:
         Returns:
             Path to the model directory.
         """
-        if self.project_name:
-            return self.storage_dir / self.project_name / name / version
-        else:
-            return self.storage_dir / name / version
+        return self._get_model_root(name) / version
     
     def _generate_version(self) -> str:
         """Generate a new version string.
         
         Returns:
-            A version string in the format 'YYYYMMDDHHmmss-uuid'.
+            A version string in the format 'YYYYMMDDHHmmss-xxxxxxxx', where the
+            suffix is 8 random base32 characters.
         """
-        timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-        uid = str(uuid.uuid4())[:8]
+        timestamp = time.strftime("%Y%m%d%H%M%S")
+        # 40 random bits as 8 base32 characters, without building a UUID
+        uid = base64.b32encode(secrets.token_bytes(5)).decode().lower()
         return f"{timestamp}-{uid}"
     
+    def _init_index_file(self, index_format: str) -> Path:
+        """Choose the registry index file, migrating it to msgpack on request.
+        
+        The index is stored as JSON (``registry_index.json``) unless msgpack
+        was requested or the registry already has a msgpack index
+        (``registry_index.mp``). Requesting msgpack converts an existing JSON
+        index once.
+        
+        Args:
+            index_format: Requested index format, "json" or "msgpack".
+            
+        Returns:
+            Path to the index file.
+            
+        Raises:
+            ImportError: If a msgpack index is requested or present but
+                msgpack is not installed.
+        """
+        json_file = self.storage_dir / "registry_index.json"
+        msgpack_file = self.storage_dir / "registry_index.mp"
+        
+        if index_format == "json" and not msgpack_file.exists():
+            return json_file
+        
+        if msgpack is None:
+            raise ImportError(
+                f"The registry index {msgpack_file} requires the msgpack package."
+            )
+        
+        if json_file.exists() and not msgpack_file.exists():
+            with open(json_file, 'rb') as f:
+                index = _json_loads(f.read())
+            self.index_file = msgpack_file
+            self._write_index(index)
+            json_file.unlink()
+        
+        return msgpack_file
+    
     def _read_index(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """Read the registry index file.
         
         Returns:
             Dictionary mapping model names to versions and metadata.
         """
-        if not self.index_file.exists():
+        try:
+            st = self.index_file.stat()
+        except FileNotFoundError:
             return {}
         
-        with open(self.index_file, 'r') as f:
-            return json.load(f)
+        index_stat = (st.st_mtime_ns, st.st_size)
+        if self._index_cache is not None and index_stat == self._index_stat:
+            return self._index_cache
+        
+        with open(self.index_file, 'rb') as f:
+            data = f.read()
+        
+        if self.index_file.suffix == ".mp":
+            index = msgpack.unpackb(data, raw=False, strict_map_key=False)
+        else:
+            index = _json_loads(data)
+        
+        self._index_cache = index
+        self._index_stat = index_stat
+        return index
     
     def _write_index(self, index: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
         """Write the registry index file.
@@ -399,8 +679,69 @@ class ModelRegistry:
         Args:
             index: Dictionary mapping model names to versions and metadata.
         """
-        with open(self.index_file, 'w') as f:
-            json.dump(index, f, indent=2)
+        # Write a temp file and rename it over the index, so a crash can't
+        # leave a truncated index and readers see either version in full
+        tmp_file: Optional[str] = None
+        try:
+            if self.index_file.suffix == ".mp":
+                data = msgpack.packb(index, use_bin_type=True)
+            else:
+                data = _json_dumps(index)
+            
+            # A unique name per write, so concurrent writers never share a
+            # temp file
+            fd, tmp_file = tempfile.mkstemp(
+                prefix=f"{self.index_file.name}.", suffix=".tmp", dir=self.index_file.parent
+            )
+            with open(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_file, 0o666 & ~_UMASK)
+            os.replace(tmp_file, self.index_file)
+        except BaseException:
+            # Callers edit the dict returned by _read_index in place, so the
+            # cache may hold changes that never reached disk; drop it
+            self._index_cache = None
+            self._index_stat = None
+            if tmp_file is not None:
+                Path(tmp_file).unlink(missing_ok=True)
+            raise
+        
+        st = self.index_file.stat()
+        self._index_cache = index
+        self._index_stat = (st.st_mtime_ns, st.st_size)
+    
+    def _rewrite_metadata(self, metadata_path: Path,
+                          mutator: Callable[[ModelMetadata], None]) -> ModelMetadata:
+        """Read, modify and rewrite a metadata file through a single handle.
+        
+        Args:
+            metadata_path: Path to the model's metadata.yaml.
+            mutator: Callable that modifies the loaded metadata in place.
+            
+        Returns:
+            The modified ModelMetadata.
+            
+        Raises:
+            FileNotFoundError: If the metadata file doesn't exist.
+            ValueError: If the metadata file is empty.
+        """
+        with open(metadata_path, 'r+') as f:
+            metadata_dict = yaml_load(f)
+            if not metadata_dict:
+                raise ValueError(f"Metadata file is empty: {metadata_path}")
+            
+            metadata = ModelMetadata.from_dict(metadata_dict)
+            mutator(metadata)
+            
+            # Render before truncating so a dump error leaves the file intact
+            content = yaml_dump(metadata.to_dict())
+            f.seek(0)
+            f.truncate()
+            f.write(content)
+        
+        return metadata
     
     def _update_index(self, name: str, version: str, metadata: ModelMetadata) -> None:
         """Update the registry index with model metadata.
@@ -416,13 +757,20 @@ class ModelRegistry:
         if name not in index:
             index[name] = {}
         
-        # Update version metadata
-        index[name][version] = {
-            "created_at": metadata.created_at,
-            "description": metadata.description,
-            "path": metadata.path,
-            "status": metadata.status
-        }
+        # Store the full metadata so that get_model_metadata can be served
+        # from the index; copied so later changes to `metadata` don't leak in.
+        # Values only YAML can hold (dates, non-string keys, ...) keep the
+        # summary entry, and get_model_metadata falls back to metadata.yaml.
+        metadata_dict = metadata.to_dict()
+        if _is_index_safe(metadata_dict):
+            index[name][version] = copy.deepcopy(metadata_dict)
+        else:
+            index[name][version] = {
+                "created_at": metadata.created_at,
+                "description": metadata.description,
+                "path": metadata.path,
+                "status": metadata.status
+            }
         
         self._write_index(index)
     
@@ -2,10 +2,37 @@
 Setup script for the llamamlops package.
 """
 
-from setuptools import setup, find_packages
+import os
+import sys
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+from setuptools import setup, find_namespace_packages
+
+
+def _read_readme():
+    """Return the README for use as the long description.
+
+    setuptools' PEP 517 backend runs a bare ``setup.py egg_info`` only to
+    collect build requirements and discards the metadata, so the read is
+    skipped there. dist_info is not skipped: pip reuses that metadata when
+    it builds the wheel.
+    """
+    if sys.argv[1:2] == ["egg_info"]:
+        return ""
+    with open("README.md", "r", encoding="utf-8") as fh:
+        return fh.read()
+
+
+# Opt-in ahead-of-time compilation of the registry module with mypyc
+ext_modules = []
+if os.environ.get("MLOPS_COMPILE") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("MLOPS_COMPILE=1 but mypyc is not installed; building pure Python")
+    else:
+        # Optional and runtime-only imports (orjson, msgpack) may not be
+        # installed in the build environment; treat them as untyped
+        ext_modules = mypycify(["--ignore-missing-imports", "llamamlops/core/registry.py"])
 
 setup(
     name="llamamlops",
@@ -13,10 +40,12 @@ setup(
     author="LlamaSearch Team",
     author_email="team@llamasearch.ai",
     description="MLOps framework for managing machine learning lifecycles",
-    long_description=long_description,
+    long_description=_read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/llamasearch/llamamlops",
-    packages=find_packages(),
+    # core/ has no __init__.py, so it is found as a namespace package
+    packages=find_namespace_packages(include=["llamamlops", "llamamlops.*"]),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -32,13 +61,11 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "pyyaml>=5.1",
+        "orjson>=3.6.0",
         "tqdm>=4.46.0",
         "click>=7.1.2",
-        "docker>=5.0.0",
         "psutil>=5.8.0",
         "requests>=2.25.0",
-        "fastapi>=0.68.0",
-        "uvicorn>=0.15.0",
     ],
     extras_require={
         "dev": [
@@ -46,9 +73,20 @@ setup(
             "pytest-cov>=2.10.0",
             "black>=21.5b2",
             "isort>=5.9.1",
-            "mypy>=0.812",
+            "mypy[mypyc]>=1.0.0",
+            "types-PyYAML>=5.1",
             "flake8>=3.9.2",
         ],
+        "docker": [
+            "docker>=5.0.0",
+        ],
+        "serving": [
+            "fastapi>=0.68.0",
+            "uvicorn>=0.15.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
         "aws": [
             "boto3>=1.17.0",
             "sagemaker>=2.35.0",
@@ -74,18 +112,7 @@ setup(
             "wandb>=0.12.0",
         ],
         "all": [
-            "boto3>=1.17.0",
-            "sagemaker>=2.35.0",
-            "azure-storage-blob>=12.8.0",
-            "azure-ml>=0.0.1",
-            "azure-mgmt-containerinstance>=7.0.0",
-            "google-cloud-storage>=1.38.0",
-            "google-cloud-bigquery>=2.20.0",
-            "google-cloud-aiplatform>=1.0.0",
-            "mlflow>=1.15.0",
-            "kubernetes>=12.0.0",
-            "tensorboard>=2.5.0",
-            "wandb>=0.12.0",
+            "llamamlops[docker,serving,msgpack,aws,azure,gcp,mlflow,kubernetes,tracking]",
         ],
     },
     entry_points={
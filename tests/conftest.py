@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the tests.
+"""
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# The MLOps framework lives under python/ and shares its top-level package
+# name with the client package that the other tests import
+FRAMEWORK_DIR = str(Path(__file__).resolve().parent.parent / "python")
+
+
+def _pop_llamamlops_modules():
+    """Remove and return every imported llamamlops module."""
+    names = [name for name in sys.modules if name == "llamamlops" or name.startswith("llamamlops.")]
+    return {name: sys.modules.pop(name) for name in names}
+
+
+@pytest.fixture(scope="module")
+def framework():
+    """Import modules from the framework package for the tests of one module.
+
+    Yields a function mapping a module name such as ``llamamlops.core.registry``
+    to the imported module. The client package is restored afterwards.
+    """
+    saved = _pop_llamamlops_modules()
+    sys.path.insert(0, FRAMEWORK_DIR)
+    try:
+        yield importlib.import_module
+    finally:
+        sys.path.remove(FRAMEWORK_DIR)
+        _pop_llamamlops_modules()
+        sys.modules.update(saved)
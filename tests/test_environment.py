@@ -0,0 +1,258 @@
+"""
+Tests for the Environment class.
+"""
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def environment_module(framework):
+    """Import the environment module."""
+    return framework("llamamlops.core.environment")
+
+
+class FakeRun:
+    """Stand-in for subprocess.run that records each command.
+
+    ``responses`` maps the leading words of a command to a callable that
+    returns its stdout; other commands succeed with no output.
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.responses = {}
+
+    def __call__(self, cmd, check=False, **kwargs):
+        self.commands.append(list(cmd))
+        stdout = "" if kwargs.get("text") else b""
+        for prefix, respond in self.responses.items():
+            if tuple(cmd[:len(prefix)]) == prefix:
+                stdout = respond(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=stdout)
+
+
+@pytest.fixture
+def fake_run(environment_module, monkeypatch):
+    """Replace subprocess.run in the environment module."""
+    run = FakeRun()
+    monkeypatch.setattr(environment_module.subprocess, "run", run)
+    return run
+
+
+@pytest.fixture
+def conda(environment_module, fake_run, monkeypatch, tmp_path):
+    """Fake a conda install with a writable base prefix under tmp_path.
+
+    Returns the list of prefixes that ``conda env list`` reports.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("CONDA_EXE", str(tmp_path / "base" / "bin" / "conda"))
+    (tmp_path / "base" / "envs").mkdir(parents=True)
+    monkeypatch.setattr(environment_module, "_tool_available", lambda tool: True)
+    environment_module._conda_base.cache_clear()
+    monkeypatch.setattr(environment_module, "_CONDA_ENVS_CACHE", None)
+
+    envs = [str(tmp_path / "base")]
+    fake_run.responses[("conda", "env", "list")] = lambda cmd: json.dumps({"envs": envs}).encode()
+    yield envs
+    environment_module._conda_base.cache_clear()
+
+
+def _conda_environment(environment_module, name="dev"):
+    """Create a conda environment object."""
+    return environment_module.Environment({"name": name, "manager": "conda"})
+
+
+def test_conda_env_found_in_envs_dir(environment_module, fake_run, conda, tmp_path):
+    """Test that an env in conda's envs directory is found without running conda."""
+    (tmp_path / "base" / "envs" / "dev").mkdir()
+    env = _conda_environment(environment_module)
+
+    assert env._init_conda()
+    assert env.env_path == str(tmp_path / "base" / "envs" / "dev")
+    assert fake_run.commands == []
+
+
+def test_conda_env_found_in_env_list(environment_module, fake_run, conda, tmp_path):
+    """Test that an env outside the envs directory is matched by exact name."""
+    (tmp_path / "base" / "envs" / "dev-legacy").mkdir()
+    conda.append(str(tmp_path / "base" / "envs" / "dev-legacy"))
+    conda.append(str(tmp_path / "elsewhere" / "dev"))
+    env = _conda_environment(environment_module)
+
+    assert env._init_conda()
+    assert env.env_path == str(tmp_path / "elsewhere" / "dev")
+    assert fake_run.commands == [["conda", "env", "list", "--json"]]
+
+
+def test_conda_env_created_with_listed_prefix(environment_module, fake_run, conda, tmp_path):
+    """Test that a new env's prefix is taken from conda's env list."""
+    prefix = str(tmp_path / "custom-envs" / "dev")
+    fake_run.responses[("conda", "create")] = lambda cmd: conda.append(prefix) or b""
+    env = _conda_environment(environment_module)
+
+    assert env._init_conda()
+    assert env.env_path == prefix
+    assert [cmd[:2] for cmd in fake_run.commands] == [
+        ["conda", "env"], ["conda", "create"], ["conda", "env"]
+    ]
+
+
+@pytest.fixture
+def probe_cache(environment_module):
+    """Start and end a test with no cached tool probes."""
+    environment_module._probe_tool.cache_clear()
+    yield
+    environment_module._probe_tool.cache_clear()
+
+
+def test_tool_probe_is_cached_per_path(environment_module, fake_run, probe_cache, monkeypatch):
+    """Test that a tool is probed once until PATH changes."""
+    monkeypatch.setattr(environment_module.shutil, "which", lambda tool, path=None: f"/usr/bin/{tool}")
+    monkeypatch.setenv("PATH", "/usr/bin")
+
+    assert environment_module._tool_available("docker")
+    assert environment_module._tool_available("docker")
+    assert fake_run.commands == [["docker", "--version"]]
+
+    monkeypatch.setenv("PATH", "/opt/bin:/usr/bin")
+    assert environment_module._tool_available("docker")
+    assert len(fake_run.commands) == 2
+
+
+def test_install_uses_environment_pip(environment_module, fake_run, tmp_path):
+    """Test that packages are installed with the environment's own pip."""
+    env = environment_module.Environment({"name": "dev", "manager": "virtualenv"})
+    env.env_path = str(tmp_path / "venv")
+
+    assert env.install_packages(["numpy"])
+    assert len(fake_run.commands) == 1
+    assert fake_run.commands[0][:2] == [str(env._get_executable("pip")), "install"]
+    assert str(tmp_path / "venv") in fake_run.commands[0][0]
+
+
+@pytest.mark.parametrize("cache_dir", [None, "wheels"])
+def test_install_from_one_requirements_file(environment_module, fake_run, tmp_path, monkeypatch, cache_dir):
+    """Test that all packages go through one pip run and the cache dir is opt-in."""
+    monkeypatch.chdir(tmp_path)
+    params = {"pip_cache_dir": cache_dir} if cache_dir else {}
+    env = environment_module.Environment({"name": "dev", "manager": "virtualenv", "params": params})
+    env.env_path = str(tmp_path / "venv")
+    pip = str(env._get_executable("pip"))
+    requirements = []
+    fake_run.responses[(pip, "install")] = lambda cmd: requirements.append(
+        Path(cmd[cmd.index("-r") + 1]).read_text()
+    ) or b""
+
+    assert env.install_packages(["numpy==1.26", "pandas"])
+    assert requirements == ["numpy==1.26\npandas\n"]
+    cmd = fake_run.commands[0]
+    if cache_dir:
+        assert cmd[cmd.index("--cache-dir") + 1] == str(tmp_path / "wheels")
+    else:
+        assert "--cache-dir" not in cmd
+
+
+def test_dockerfile_rendering(environment_module, tmp_path):
+    """Test the Dockerfile generated for an environment with variables and packages."""
+    env = environment_module.Environment({
+        "name": "dev", "manager": "docker",
+        "env_variables": {"A": "1", "B": "two"}, "python_packages": ["numpy==1.26", "pandas"],
+    })
+    env._create_dockerfile(str(tmp_path / "Dockerfile"))
+
+    assert (tmp_path / "Dockerfile").read_bytes() == (
+        b"FROM python:3.8-slim\n"
+        b"\n"
+        b"ENV A=1\n"
+        b"ENV B=two\n"
+        b"\n"
+        b"RUN pip install --no-cache-dir \\\n"
+        b"    numpy==1.26 \\\n"
+        b"    pandas\n"
+        b"\n"
+        b"WORKDIR /app\n"
+        b"\n"
+        b"COPY . /app/\n"
+        b"\n"
+        b'CMD ["python", "-m", "llamamlops.cli"]\n'
+    )
+
+
+def test_docker_commands_use_long_lived_container(environment_module, fake_run):
+    """Test that commands run in the started container, which close() removes once."""
+    fake_run.responses[("docker", "run", "-d")] = lambda cmd: "abc123\n"
+    env = environment_module.Environment({"name": "Web", "manager": "docker"})
+
+    env._start_container("llamamlops-web")
+    start = fake_run.commands[0]
+    assert start[start.index("--name") + 1].startswith("llamamlops-web-")
+    assert env.container_id == "abc123"
+
+    env.run(["python", "train.py"])
+    assert fake_run.commands[-1] == ["docker", "exec", "abc123", "python", "train.py"]
+
+    env.close()
+    env.close()
+    assert fake_run.commands[2:] == [["docker", "rm", "-f", "abc123"]]
+    assert env.container_id is None
+
+
+def test_docker_commands_without_container(environment_module, fake_run):
+    """Test that run() starts a fresh container per command if none could be kept."""
+    def fail(cmd):
+        raise subprocess.CalledProcessError(125, cmd, stderr="no sleep in image\n")
+
+    fake_run.responses[("docker", "run", "-d")] = fail
+    with environment_module.Environment({"name": "Web", "manager": "docker"}) as env:
+        env._start_container("llamamlops-web")
+        assert env.container_id is None
+
+        env.run(["python", "train.py"])
+        cmd = fake_run.commands[-1]
+        assert cmd[:3] == ["docker", "run", "--rm"]
+        assert cmd[-3:] == ["llamamlops-web", "python", "train.py"]
+    assert len(fake_run.commands) == 2
+
+
+def test_dockerfile_rendering_without_optional_blocks(environment_module, tmp_path):
+    """Test the Dockerfile generated when there are no variables or packages."""
+    env = environment_module.Environment({"name": "dev", "manager": "docker", "base_image": "python:3.11"})
+    env._create_dockerfile(str(tmp_path / "Dockerfile"))
+
+    assert (tmp_path / "Dockerfile").read_bytes() == (
+        b"FROM python:3.11\n"
+        b"\n"
+        b"WORKDIR /app\n"
+        b"\n"
+        b"COPY . /app/\n"
+        b"\n"
+        b'CMD ["python", "-m", "llamamlops.cli"]\n'
+    )
+
+
+def test_dockerfile_replaced_atomically(environment_module, tmp_path, monkeypatch):
+    """Test that the Dockerfile is swapped into place and a failed write leaves no temp file."""
+    path = tmp_path / "Dockerfile"
+    path.write_text("FROM old\n")
+    env = environment_module.Environment({"name": "dev", "manager": "docker"})
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(environment_module.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            env._create_dockerfile(str(path))
+    assert path.read_text() == "FROM old\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["Dockerfile"]
+
+    env._create_dockerfile(str(path))
+    assert path.read_text().startswith("FROM python:3.8-slim\n")
+    assert [p.name for p in tmp_path.iterdir()] == ["Dockerfile"]
+    if os.name == "posix":
+        assert path.stat().st_mode & 0o777 == 0o644
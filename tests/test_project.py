@@ -0,0 +1,57 @@
+"""
+Tests for the Project class and its configuration.
+"""
+import json
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def project_module(framework):
+    """Import the project module."""
+    return framework("llamamlops.core.project")
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".YML", ".json"])
+def test_load_config_by_extension(project_module, tmp_path, suffix):
+    """Test that a config file is loaded with the loader for its extension."""
+    path = tmp_path / f"project{suffix}"
+    config = {"name": "demo", "dependencies": ["numpy"]}
+    if suffix == ".json":
+        path.write_text(json.dumps(config))
+    else:
+        project_module.ProjectConfig.from_dict(config).to_yaml(str(path))
+
+    project = project_module.Project(str(path))
+    assert project.config.name == "demo"
+    assert project.config.dependencies == ["numpy"]
+
+
+def test_unsupported_config_extension(project_module, tmp_path):
+    """Test that a config file with an unknown extension is rejected."""
+    with pytest.raises(ValueError):
+        project_module.Project(str(tmp_path / "project.toml"))
+
+
+def test_to_yaml_file_matches_string(project_module, tmp_path):
+    """Test that streaming the config to a file writes the same YAML as the string form."""
+    config = project_module.ProjectConfig(name="demo", params={"lr": 0.1, "layers": [64, 32]})
+    path = tmp_path / "project.yaml"
+
+    assert config.to_yaml(str(path)) is None
+    assert path.read_text() == config.to_yaml()
+    assert project_module.ProjectConfig.from_yaml(str(path)).to_dict() == config.to_dict()
+
+
+def test_yaml_keeps_field_order_and_writes_paths_as_strings(project_module, tmp_path):
+    """Test that config YAML follows the field order and stores paths as plain strings."""
+    config = project_module.ProjectConfig(name="demo", params={"output": tmp_path / "out"})
+    text = config.to_yaml()
+
+    keys = [line.split(":")[0] for line in text.splitlines() if not line.startswith((" ", "-"))]
+    assert keys == list(config.to_dict())
+    assert "!!python" not in text
+
+    path = tmp_path / "project.yaml"
+    path.write_text(text)
+    assert project_module.ProjectConfig.from_yaml(str(path)).params == {"output": str(tmp_path / "out")}
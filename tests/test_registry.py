@@ -0,0 +1,282 @@
+"""
+Tests for the ModelRegistry class.
+"""
+import datetime
+import os
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+
+@pytest.fixture(scope="module")
+def registry_module(framework):
+    """Import the registry module."""
+    return framework("llamamlops.core.registry")
+
+
+@pytest.fixture(params=["json", "msgpack"])
+def index_format(request):
+    """Run a test against both index backends."""
+    if request.param == "msgpack":
+        pytest.importorskip("msgpack")
+    return request.param
+
+
+@pytest.fixture
+def registry(registry_module, index_format, tmp_path):
+    """Create an empty registry."""
+    return registry_module.ModelRegistry(str(tmp_path / "registry"), index_format=index_format)
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    """Create a small model file."""
+    path = tmp_path / "model.pkl"
+    path.write_bytes(b"x" * 100)
+    return path
+
+
+def test_register_update_get_delete(registry_module, registry, index_format, model_file):
+    """Test a model's round trip through the registry."""
+    metadata = registry.register_model(
+        str(model_file), "clf", version="v1", description="first",
+        metadata={"framework": "sklearn", "metrics": {"accuracy": 0.9}, "team": "ml"}
+    )
+    assert metadata.size_bytes == 100
+    assert metadata.custom == {"team": "ml"}
+    assert Path(registry.get_model("clf")).read_bytes() == b"x" * 100
+
+    updated = registry.update_model_metadata("clf", "v1", {"status": "deployed", "note": "n"})
+    assert updated.status == "deployed"
+    assert updated.custom == {"team": "ml", "note": "n"}
+
+    # A fresh instance reads the index and metadata.yaml from disk
+    reopened = registry_module.ModelRegistry(str(registry.storage_dir), index_format=index_format)
+    fetched = reopened.get_model_metadata("clf")
+    assert fetched.to_dict() == updated.to_dict()
+    assert reopened.list_versions("clf") == ["v1"]
+
+    registry.register_model(str(model_file), "clf", version="v2")
+    assert registry.delete_model("clf", "v1")
+    assert registry.list_versions("clf") == ["v2"]
+    assert not (registry.storage_dir / "clf" / "v1").exists()
+
+
+def test_failed_index_write_keeps_cache_consistent(registry_module, registry, model_file, monkeypatch):
+    """Test that a failed index write doesn't leave unsaved entries cached."""
+    registry.register_model(str(model_file), "clf", version="v1")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(registry_module.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            registry.register_model(str(model_file), "broken", version="v1")
+
+    assert registry.list_models() == ["clf"]
+    assert not list(registry.storage_dir.glob("*.tmp"))
+
+    registry.register_model(str(model_file), "other", version="v1")
+    assert sorted(registry.list_models()) == ["clf", "other"]
+
+
+def test_concurrent_index_writes(registry_module, registry, index_format):
+    """Test that threads writing the index at once don't share a temp file."""
+    errors = []
+
+    def write_index(worker):
+        writer = registry_module.ModelRegistry(str(registry.storage_dir), index_format=index_format)
+        try:
+            for i in range(20):
+                writer._write_index({f"model{worker}": {f"v{i}": {"status": "registered"}}})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write_index, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert not list(registry.storage_dir.glob("*.tmp"))
+    assert len(registry._read_index()) == 1
+    if os.name == "posix":
+        assert registry.index_file.stat().st_mode & 0o777 == 0o666 & ~registry_module._UMASK
+
+
+@pytest.mark.parametrize("ingest_mode", ["copy", "link", "reflink"])
+def test_ingest_modes(registry, model_file, ingest_mode):
+    """Test registering a model file with each ingest mode."""
+    metadata = registry.register_model(str(model_file), "clf", version="v1", ingest_mode=ingest_mode)
+
+    stored = registry.storage_dir / metadata.path
+    assert stored.read_bytes() == model_file.read_bytes()
+    if ingest_mode == "link":
+        assert os.path.samefile(stored, model_file)
+    else:
+        assert not os.path.samefile(stored, model_file)
+
+
+def test_unsupported_ingest_mode(registry, model_file):
+    """Test that an unknown ingest mode is rejected."""
+    with pytest.raises(ValueError):
+        registry.register_model(str(model_file), "clf", ingest_mode="move")
+
+
+def test_msgpack_migration_is_opt_in(registry_module, model_file, tmp_path):
+    """Test that a JSON index is only converted to msgpack on request."""
+    pytest.importorskip("msgpack")
+    storage_dir = str(tmp_path / "registry")
+
+    registry = registry_module.ModelRegistry(storage_dir)
+    registry.register_model(str(model_file), "clf", version="v1")
+    assert registry.index_file.name == "registry_index.json"
+
+    migrated = registry_module.ModelRegistry(storage_dir, index_format="msgpack")
+    assert migrated.index_file.name == "registry_index.mp"
+    assert not (tmp_path / "registry" / "registry_index.json").exists()
+    assert migrated.list_versions("clf") == ["v1"]
+
+    # An existing msgpack index is kept without asking for it again
+    reopened = registry_module.ModelRegistry(storage_dir)
+    assert reopened.index_file.name == "registry_index.mp"
+
+    with pytest.raises(ValueError):
+        registry_module.ModelRegistry(storage_dir, index_format="yaml")
+
+
+def test_msgpack_index_with_non_string_keys(registry_module, tmp_path):
+    """Test that a msgpack index with non-string map keys can be read back."""
+    pytest.importorskip("msgpack")
+    storage_dir = str(tmp_path / "registry")
+
+    registry = registry_module.ModelRegistry(storage_dir, index_format="msgpack")
+    registry._write_index({"clf": {"v1": {"scores": {1: 0.5}}}})
+
+    reopened = registry_module.ModelRegistry(storage_dir)
+    assert reopened._read_index() == {"clf": {"v1": {"scores": {1: 0.5}}}}
+
+
+def test_register_model_directory(registry, tmp_path):
+    """Test registering a model directory with nested files."""
+    model_dir = tmp_path / "model"
+    (model_dir / "sub").mkdir(parents=True)
+    for i in range(20):
+        (model_dir / f"part{i}.bin").write_bytes(b"a" * 10)
+    (model_dir / "sub" / "weights.bin").write_bytes(b"b" * 20)
+
+    metadata = registry.register_model(str(model_dir), "clf", version="v1")
+
+    stored = registry.storage_dir / metadata.path
+    assert metadata.size_bytes == 220
+    assert (stored / "sub" / "weights.bin").read_bytes() == b"b" * 20
+    assert sorted(p.name for p in stored.glob("part*.bin")) == sorted(f"part{i}.bin" for i in range(20))
+
+
+def test_metadata_the_index_cannot_encode(registry_module, registry, index_format, model_file):
+    """Test that YAML-only metadata values are kept out of the index."""
+    trained = datetime.date(2024, 1, 2)
+    metadata = registry.register_model(
+        str(model_file), "clf", version="v1",
+        metadata={"custom": {1: "one"}, "trained": trained}
+    )
+    assert metadata.custom == {1: "one", "trained": trained}
+
+    registry.update_model_metadata("clf", "v1", {"checked": datetime.date(2024, 1, 3)})
+    registry.register_model(str(model_file), "other", version="v1")
+
+    reopened = registry_module.ModelRegistry(str(registry.storage_dir), index_format=index_format)
+    assert reopened.get_model_metadata("clf", "v1").custom == {
+        1: "one", "trained": trained, "checked": datetime.date(2024, 1, 3)
+    }
+    assert sorted(reopened.list_models()) == ["clf", "other"]
+
+
+def test_metadata_with_large_integers(registry_module, registry, index_format, model_file):
+    """Test that integers wider than 64 bits are kept out of the index."""
+    registry.register_model(str(model_file), "clf", version="v1", metadata={"seed": 2**70})
+    registry.register_model(str(model_file), "other", version="v1", metadata={"seed": -2**63})
+
+    reopened = registry_module.ModelRegistry(str(registry.storage_dir), index_format=index_format)
+    assert reopened.get_model_metadata("clf", "v1").custom == {"seed": 2**70}
+    assert reopened.get_model_metadata("other", "v1").custom == {"seed": -2**63}
+
+
+def test_delete_all_versions(registry, model_file):
+    """Test that deleting a model removes every version and its directory."""
+    registry.register_model(str(model_file), "clf", version="v1")
+    registry.register_model(str(model_file), "clf", version="v2")
+    registry.register_model(str(model_file), "other", version="v1")
+
+    assert registry.delete_model("clf")
+    assert registry.list_models() == ["other"]
+    assert not (registry.storage_dir / "clf").exists()
+    assert not registry.delete_model("clf")
+
+
+def test_update_missing_model(registry):
+    """Test that updating an unknown model raises ValueError."""
+    with pytest.raises(ValueError):
+        registry.update_model_metadata("missing", "v1", {"status": "deployed"})
+
+
+def test_metadata_rewrite_truncates(registry, model_file):
+    """Test that a shorter metadata file leaves no stale content behind."""
+    registry.register_model(str(model_file), "clf", version="v1", description="x" * 500)
+    registry.update_model_metadata("clf", "v1", {"description": "short"})
+
+    metadata_path = registry.storage_dir / "clf" / "v1" / "metadata.yaml"
+    assert "x" * 10 not in metadata_path.read_text()
+    assert registry.get_model_metadata("clf", "v1").description == "short"
+
+
+def test_failed_metadata_update_keeps_file(registry, model_file):
+    """Test that a metadata update that can't be dumped leaves the file intact."""
+    registry.register_model(str(model_file), "clf", version="v1", description="first")
+    metadata_path = registry.storage_dir / "clf" / "v1" / "metadata.yaml"
+    before = metadata_path.read_text()
+
+    with pytest.raises(yaml.representer.RepresenterError):
+        registry.update_model_metadata("clf", "v1", {"handle": object()})
+
+    assert metadata_path.read_text() == before
+    updated = registry.update_model_metadata("clf", "v1", {"status": "deployed"})
+    assert updated.description == "first"
+
+
+def test_update_with_empty_metadata_file(registry, model_file):
+    """Test that updating a model whose metadata file is empty raises ValueError."""
+    registry.register_model(str(model_file), "clf", version="v1")
+    (registry.storage_dir / "clf" / "v1" / "metadata.yaml").write_text("")
+
+    with pytest.raises(ValueError):
+        registry.update_model_metadata("clf", "v1", {"status": "deployed"})
+
+
+class _Score(float):
+    """Float subclass standing in for a numpy scalar."""
+
+
+def test_metadata_with_numeric_subclasses(registry_module, registry, index_format, model_file):
+    """Test that numeric scalar subclasses are stored as plain numbers."""
+    registry.register_model(
+        str(model_file), "clf", version="v1", metadata={"metrics": {"accuracy": _Score(0.5)}}
+    )
+
+    reopened = registry_module.ModelRegistry(str(registry.storage_dir), index_format=index_format)
+    metrics = reopened.get_model_metadata("clf", "v1").metrics
+    assert metrics == {"accuracy": 0.5}
+    assert type(metrics["accuracy"]) is float
+
+
+def test_failed_register_leaves_no_files(registry, model_file):
+    """Test that metadata YAML can't represent is rejected before copying."""
+    with pytest.raises(yaml.representer.RepresenterError):
+        registry.register_model(str(model_file), "clf", version="v1", metadata={"handle": object()})
+
+    assert not (registry.storage_dir / "clf").exists()
+    assert registry.list_models() == []
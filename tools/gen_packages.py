@@ -0,0 +1,60 @@
+"""
+Regenerate the explicit package list in pyproject.toml.
+
+Listing packages literally spares setuptools a walk of src/ on every build.
+Run this after adding or removing a subpackage; ``--check`` only reports
+whether the list is stale and is what CI runs.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import List
+
+from setuptools import find_packages
+
+ROOT = Path(__file__).resolve().parent.parent
+PYPROJECT = ROOT / "pyproject.toml"
+PACKAGES_LINE = re.compile(r"^packages = \[.*\]$", re.MULTILINE)
+
+
+def discover_packages() -> List[str]:
+    """Find the packages under src/ the same way setuptools would."""
+    return sorted(find_packages(where=str(ROOT / "src"), include=["llamamlops", "llamamlops.*"]))
+
+
+def render_packages(packages: List[str]) -> str:
+    """Render the ``packages`` line for the [tool.setuptools] table."""
+    return "packages = [" + ", ".join(f'"{name}"' for name in packages) + "]"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero if pyproject.toml is out of date")
+    args = parser.parse_args()
+
+    content = PYPROJECT.read_text(encoding="utf-8")
+    if len(PACKAGES_LINE.findall(content)) != 1:
+        print("Expected exactly one 'packages = [...]' line in pyproject.toml")
+        return 1
+
+    expected = render_packages(discover_packages())
+    updated = PACKAGES_LINE.sub(lambda _: expected, content)
+    if updated == content:
+        print("pyproject.toml package list is up to date")
+        return 0
+
+    if args.check:
+        print("pyproject.toml package list is stale; run tools/gen_packages.py")
+        print(f"  expected: {expected}")
+        return 1
+
+    PYPROJECT.write_text(updated, encoding="utf-8")
+    print(f"Updated pyproject.toml: {expected}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())